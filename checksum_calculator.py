@@ -1,21 +1,237 @@
 import hashlib
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Quick check fingerprints are prefixed so they can never be mistaken for
+# a full cryptographic digest of the file contents.
+QUICK_PREFIX = "quick:"
+
+
+class BufferPool:
+    # Fixed number of reusable read buffers shared by every job on a
+    # calculator. Buffers are allocated on first use and kept afterwards.
+    def __init__(self, memory_budget: int, chunk_size: int):
+        if chunk_size <= 0 or memory_budget < 2 * chunk_size:
+            raise ValueError("memory_budget must hold at least two chunks")
+        self.chunk_size = chunk_size
+        self.capacity = memory_budget // chunk_size
+        self.available = self.capacity
+        self.free = []
+        self.condition = threading.Condition()
+
+    def acquire(self, count: int = 1) -> list:
+        # All-or-nothing, so callers waiting here never hold part of a set
+        count = min(count, self.capacity)
+        with self.condition:
+            self.condition.wait_for(lambda: self.available >= count)
+            self.available -= count
+            buffers = [self.free.pop() for _ in range(min(count, len(self.free)))]
+        return buffers + [bytearray(self.chunk_size) for _ in range(count - len(buffers))]
+
+    def release(self, buffers: list):
+        with self.condition:
+            self.free.extend(buffers)
+            self.available += len(buffers)
+            self.condition.notify_all()
+
 
 class ChecksumCalculator:
-    def __init__(self):
+    def __init__(self, memory_budget: int = 64 * 1024 * 1024,
+                 chunk_size: int = 1024 * 1024):
         self.hash_functions = {
             'MD5': hashlib.md5,
             'SHA-1': hashlib.sha1,
             'SHA-256': hashlib.sha256,
             'SHA-512': hashlib.sha512
         }
+        self.quick_samples = 16
+        self.quick_block_size = 64 * 1024
+        # Upper bound on buffer memory shared by all in-flight batch jobs
+        if memory_budget < 2 or chunk_size <= 0:
+            raise ValueError("memory_budget must be at least 2 and chunk_size positive")
+        self.memory_budget = memory_budget
+        # At least two buffers must fit for calculate_parts to make progress
+        self.chunk_size = min(chunk_size, memory_budget // 2)
+        self.buffer_pool = BufferPool(memory_budget, self.chunk_size)
+        self.max_workers = os.cpu_count() or 1
 
     def calculate(self, filepath: str, hash_type: str) -> str:
+        return self._hash_file(filepath, hash_type, bytearray(8192))
+
+    def calculate_many(self, filepaths, hash_type: str):
+        # Yields (filepath, digest) pairs in completion order. Every read
+        # borrows a buffer from the shared pool, so concurrent reads across
+        # all jobs stay within memory_budget; a bounded result queue stalls
+        # the workers when the consumer falls behind, so memory does not grow
+        # with the batch. Errors raised by the filepaths iterable are
+        # re-raised here.
+        workers = max(1, min(self.max_workers, self.buffer_pool.capacity))
+        results = queue.Queue(maxsize=workers)
+        paths = iter(filepaths)
+        paths_lock = threading.Lock()
+        stop = threading.Event()
+
+        def post(item):
+            # Give up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def worker():
+            try:
+                while not stop.is_set():
+                    with paths_lock:
+                        filepath = next(paths, None)
+                    if filepath is None:
+                        break
+                    buffer, = self.buffer_pool.acquire()
+                    try:
+                        digest = self._hash_file(filepath, hash_type, buffer, stop)
+                    finally:
+                        self.buffer_pool.release([buffer])
+                    post((filepath, digest))
+            except Exception as e:
+                post(e)
+            finally:
+                post(None)
+
+        for _ in range(workers):
+            threading.Thread(target=worker, daemon=True).start()
+
+        try:
+            running = workers
+            while running:
+                item = results.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Workers notice this between chunks and exit on their own
+            stop.set()
+
+    def calculate_parts(self, filepaths, hash_type: str):
+        # Returns ([part digests], digest of the concatenation) reading each
+        # part once. Parts are hashed on a thread pool and pass filled
+        # buffers through per-part queues to the whole-file hash, which this
+        # thread consumes in part order. Buffers are reserved up front from
+        # the shared pool (at most half of it) and each running part may hold
+        # at most its share, so the part being consumed can always progress.
+        filepaths = list(filepaths)
+        hash_factory = self.hash_functions.get(hash_type, hashlib.sha256)
+        share = max(2, self.buffer_pool.capacity // 2)
+        workers = max(1, min(self.max_workers, len(filepaths), share // 2))
+        # A producer holds up to depth queued buffers plus the one it is filling
+        depth = share // workers - 1
+        reserved = self.buffer_pool.acquire(workers * (depth + 1))
+        free_buffers = queue.Queue()
+        for buffer in reserved:
+            free_buffers.put(buffer)
+        chunk_queues = [queue.Queue(maxsize=depth) for _ in filepaths]
+        window = threading.Condition()
+        consuming = 0
+        failed = object()
+
+        def hash_part(index):
+            with window:
+                window.wait_for(lambda: index < consuming + workers)
+            part_hash = hash_factory()
+            chunks = chunk_queues[index]
+            buffer = None
+            try:
+                with open(filepaths[index], 'rb') as file:
+                    while True:
+                        buffer = free_buffers.get()
+                        size = file.readinto(buffer)
+                        if not size:
+                            break
+                        part_hash.update(memoryview(buffer)[:size])
+                        chunks.put((buffer, size))
+                        buffer = None
+                free_buffers.put(buffer)
+                return part_hash.hexdigest()
+            except Exception as e:
+                if buffer is not None:
+                    free_buffers.put(buffer)
+                chunks.put(failed)
+                return f"Error: {str(e)}"
+            finally:
+                chunks.put(None)
+
+        whole_hash = hash_factory()
+        whole_error = None
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(hash_part, i) for i in range(len(filepaths))]
+                for index, chunks in enumerate(chunk_queues):
+                    with window:
+                        consuming = index
+                        window.notify_all()
+                    while (chunk := chunks.get()) is not None:
+                        if chunk is failed:
+                            whole_error = whole_error or f"Error: part {index + 1} failed"
+                            continue
+                        buffer, size = chunk
+                        if whole_error is None:
+                            whole_hash.update(memoryview(buffer)[:size])
+                        free_buffers.put(buffer)
+                part_digests = [future.result() for future in futures]
+        finally:
+            self.buffer_pool.release(reserved)
+
+        return part_digests, whole_error or whole_hash.hexdigest()
+
+    def _hash_file(self, filepath: str, hash_type: str, buffer: bytearray,
+                   stop: threading.Event = None) -> str:
         hash_func = self.hash_functions.get(hash_type, hashlib.sha256)()
-        
+        view = memoryview(buffer)
+
         try:
             with open(filepath, 'rb') as file:
-                while chunk := file.read(8192):
-                    hash_func.update(chunk)
+                while size := file.readinto(buffer):
+                    if stop is not None and stop.is_set():
+                        return "Error: cancelled"
+                    hash_func.update(view[:size])
             return hash_func.hexdigest()
         except Exception as e:
             return f"Error: {str(e)}"
+
+    def quick_fingerprint(self, filepath: str, hash_type: str) -> str:
+        # Not a full digest: hashes the file size plus a fixed number of
+        # evenly spaced blocks, so the cost does not grow with file size.
+        hash_func = self.hash_functions.get(hash_type, hashlib.sha256)()
+
+        try:
+            size = os.path.getsize(filepath)
+            hash_func.update(size.to_bytes(8, 'little'))
+            with open(filepath, 'rb') as file:
+                for offset in self._sample_offsets(size):
+                    file.seek(offset)
+                    hash_func.update(file.read(self.quick_block_size))
+            return QUICK_PREFIX + hash_func.hexdigest()
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+    def quick_check(self, filepath: str, hash_type: str, fingerprint: str):
+        # Returns (fingerprint, digest). digest is None when the fingerprint
+        # still matches; any mismatch falls back to a full hash.
+        current = self.quick_fingerprint(filepath, hash_type)
+        if current == fingerprint and not current.startswith("Error:"):
+            return current, None
+        return current, self.calculate(filepath, hash_type)
+
+    def _sample_offsets(self, size: int) -> list:
+        block = self.quick_block_size
+        if size <= block * self.quick_samples:
+            return list(range(0, size, block)) or [0]
+        # First and last blocks are always included
+        last = size - block
+        step = last / (self.quick_samples - 1)
+        return [round(i * step) for i in range(self.quick_samples)]
@@ -0,0 +1,155 @@
+import csv
+import json
+import os
+import sqlite3
+import time
+
+
+class HistoryStore:
+    columns = [
+        "filepath",
+        "size",
+        "algorithm",
+        "digest",
+        "duration",
+        "throughput",
+        "computed_at",
+    ]
+
+    def __init__(self, db_path: str = None):
+        if db_path is None:
+            db_dir = os.path.join(os.path.expanduser("~"), ".checksum_verifier")
+            os.makedirs(db_dir, exist_ok=True)
+            db_path = os.path.join(db_dir, "history.db")
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY,
+                filepath TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                algorithm TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                duration REAL NOT NULL,
+                throughput REAL NOT NULL,
+                computed_at REAL NOT NULL,
+                quick_fingerprint TEXT
+            )
+        """
+        )
+        # Databases created before quick fingerprints were stored
+        existing = [row[1] for row in self.connection.execute("PRAGMA table_info(history)")]
+        if "quick_fingerprint" not in existing:
+            self.connection.execute(
+                "ALTER TABLE history ADD COLUMN quick_fingerprint TEXT"
+            )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS history_lookup"
+            " ON history (filepath, algorithm, size, mtime_ns)"
+        )
+        self.connection.commit()
+
+    def add(self, filepath, size, mtime_ns, algorithm, digest, duration,
+            quick_fingerprint=None):
+        throughput = size / duration if duration > 0 else 0.0
+        self.connection.execute(
+            "INSERT INTO history (filepath, size, mtime_ns, algorithm, digest,"
+            " duration, throughput, computed_at, quick_fingerprint)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (filepath, size, mtime_ns, algorithm, digest, duration, throughput,
+             time.time(), quick_fingerprint),
+        )
+        self.connection.commit()
+
+    def lookup(self, filepath, algorithm, size, mtime_ns):
+        # Only a digest computed from identical stat data is reused. Returns
+        # (digest, quick_fingerprint taken with it) or None.
+        return self.connection.execute(
+            "SELECT digest, quick_fingerprint FROM history WHERE filepath = ?"
+            " AND algorithm = ? AND size = ? AND mtime_ns = ?"
+            " ORDER BY id DESC LIMIT 1",
+            (filepath, algorithm, size, mtime_ns),
+        ).fetchone()
+
+    def count(self, search: str = "") -> int:
+        where, params = self._filter(search)
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM history {where}", params
+        ).fetchone()[0]
+
+    def rows(self, offset: int, limit: int, search: str = "") -> list:
+        where, params = self._filter(search)
+        return self.connection.execute(
+            f"SELECT {', '.join(self.columns)} FROM history {where}"
+            " ORDER BY id DESC LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+
+    def clear(self):
+        self.connection.execute("DELETE FROM history")
+        self.connection.commit()
+
+    def export_csv(self, path: str, search: str = ""):
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.columns)
+            writer.writerows(self._iter_rows(search))
+
+    def export_json(self, path: str, search: str = ""):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                [dict(zip(self.columns, row)) for row in self._iter_rows(search)],
+                file,
+                indent=2,
+            )
+
+    def algorithms(self) -> list:
+        return [
+            row[0]
+            for row in self.connection.execute(
+                "SELECT DISTINCT algorithm FROM history ORDER BY algorithm"
+            )
+        ]
+
+    def export_manifest(self, path: str, algorithm: str, search: str = ""):
+        # sha256sum-style "<digest>  <file>" lines for a single algorithm, so
+        # the file can be checked with md5sum -c / sha256sum -c etc. Only the
+        # newest entry per file is written.
+        where, params = self._filter(search, algorithm)
+        rows = self.connection.execute(
+            "SELECT digest, filepath FROM history WHERE id IN"
+            f" (SELECT MAX(id) FROM history {where} GROUP BY filepath)"
+            " ORDER BY filepath",
+            params,
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            for digest, filepath in rows:
+                file.write(f"{digest}  {filepath}\n")
+
+    def _iter_rows(self, search: str):
+        where, params = self._filter(search)
+        return self.connection.execute(
+            f"SELECT {', '.join(self.columns)} FROM history {where} ORDER BY id DESC",
+            params,
+        )
+
+    def _filter(self, search: str, algorithm: str = None):
+        conditions, params = [], []
+        if search:
+            # Match % and _ literally in user input
+            escaped = (
+                search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            pattern = f"%{escaped}%"
+            conditions.append(
+                "(filepath LIKE ? ESCAPE '\\' OR digest LIKE ? ESCAPE '\\'"
+                " OR algorithm LIKE ? ESCAPE '\\')"
+            )
+            params += [pattern, pattern, pattern]
+        if algorithm:
+            conditions.append("algorithm = ?")
+            params.append(algorithm)
+        if not conditions:
+            return "", []
+        return "WHERE " + " AND ".join(conditions), params
@@ -0,0 +1,278 @@
+import sqlite3
+from datetime import datetime
+
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLineEdit,
+    QPushButton,
+    QTableView,
+    QHeaderView,
+    QFileDialog,
+    QAbstractItemView,
+    QLabel,
+    QMessageBox,
+    QInputDialog,
+)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+
+
+class HistoryModel(QAbstractTableModel):
+    # Rows are fetched from SQLite one page at a time as the view scrolls,
+    # so only a handful of pages are ever held in memory.
+    page_size = 256
+    max_cached_pages = 16
+    headers = ["File", "Size", "Algorithm", "Digest", "Duration", "Throughput", "Computed"]
+
+    def __init__(self, store, format_size):
+        super().__init__()
+        self.store = store
+        self.format_size = format_size
+        self.search = ""
+        self.row_count = store.count()
+        self.pages = {}
+
+    def set_search(self, search):
+        self.beginResetModel()
+        self.search = search
+        self.refresh_count()
+        self.endResetModel()
+
+    def reload(self):
+        self.beginResetModel()
+        self.refresh_count()
+        self.endResetModel()
+
+    def insert_new_rows(self):
+        # New entries sort first, so insert them at the top instead of
+        # resetting the model and losing scroll position and selection
+        added = self.store.count(self.search) - self.row_count
+        if added <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), 0, added - 1)
+        self.pages.clear()
+        self.row_count += added
+        self.endInsertRows()
+
+    def refresh_count(self):
+        self.pages.clear()
+        self.row_count = self.store.count(self.search)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = self.row_at(index.row())
+        if row is None:
+            return None
+        filepath, size, algorithm, digest, duration, throughput, computed_at = row
+        return [
+            filepath,
+            self.format_size(size),
+            algorithm,
+            digest,
+            f"{duration:.3f} s",
+            f"{self.format_size(throughput)}/s",
+            datetime.fromtimestamp(computed_at).strftime("%Y-%m-%d %H:%M:%S"),
+        ][index.column()]
+
+    def row_at(self, row):
+        page, offset = divmod(row, self.page_size)
+        if page not in self.pages:
+            if len(self.pages) >= self.max_cached_pages:
+                self.pages.pop(next(iter(self.pages)))
+            self.pages[page] = self.store.rows(
+                page * self.page_size, self.page_size, self.search
+            )
+        rows = self.pages[page]
+        return rows[offset] if offset < len(rows) else None
+
+
+class HistoryWindow(QDialog):
+    def __init__(self, store, format_size, open_entry, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Checksum History")
+        self.resize(1000, 600)
+        self.store = store
+        self.open_entry = open_entry
+        self.model = HistoryModel(store, format_size)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search file, digest or algorithm...")
+        self.search_input.setStyleSheet(
+            """
+            QLineEdit {
+                padding: 10px;
+                border: 2px solid #e0e0e0;
+                border-radius: 6px;
+                font-size: 14px;
+                background: white;
+                color: #333333;
+            }
+            QLineEdit:focus {
+                border-color: #333333;
+            }
+        """
+        )
+        # Debounce so typing doesn't run a COUNT(*) per keystroke
+        self.search_timer = QTimer()
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.search_input.textChanged.connect(lambda: self.search_timer.start(250))
+        layout.addWidget(self.search_input)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().hide()
+        # Fixed row heights and header modes avoid measuring every row
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Interactive
+        )
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setColumnWidth(0, 300)
+        self.table.setColumnWidth(3, 300)
+        self.table.setStyleSheet(
+            """
+            QTableView {
+                border: 1px solid #e0e0e0;
+                border-radius: 6px;
+                background: white;
+                font-size: 13px;
+            }
+        """
+        )
+        self.table.doubleClicked.connect(self.open_selected)
+        layout.addWidget(self.table)
+
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet("QLabel { color: #666666; font-size: 13px; }")
+
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(10)
+        button_layout.addWidget(self.count_label)
+        button_layout.addStretch()
+        for text, handler in [
+            ("Export CSV", self.export_csv),
+            ("Export JSON", self.export_json),
+            ("Export Manifest", self.export_manifest),
+            ("Clear History", self.clear_history),
+        ]:
+            button = QPushButton(text)
+            button.setStyleSheet(
+                """
+                QPushButton {
+                    background-color: #ffffff;
+                    color: #333333;
+                    border: 2px solid #333333;
+                    padding: 8px 16px;
+                    border-radius: 6px;
+                    font-size: 13px;
+                    font-weight: bold;
+                }
+                QPushButton:hover {
+                    background-color: #333333;
+                    color: white;
+                }
+            """
+            )
+            button.clicked.connect(handler)
+            button_layout.addWidget(button)
+        layout.addLayout(button_layout)
+
+        self.update_count()
+
+    def showEvent(self, event):
+        self.refresh()
+        super().showEvent(event)
+
+    def refresh(self):
+        self.model.reload()
+        self.update_count()
+
+    def entry_added(self):
+        self.model.insert_new_rows()
+        self.update_count()
+
+    def apply_search(self):
+        self.model.set_search(self.search_input.text().strip())
+        self.update_count()
+
+    def update_count(self):
+        self.count_label.setText(f"{self.model.row_count} entries")
+
+    def open_selected(self, index):
+        row = self.model.row_at(index.row())
+        if row is not None:
+            filepath, _, algorithm = row[:3]
+            self.open_entry(filepath, algorithm)
+
+    def export_csv(self):
+        self.export("CSV files (*.csv)", self.store.export_csv)
+
+    def export_json(self):
+        self.export("JSON files (*.json)", self.store.export_json)
+
+    def export_manifest(self):
+        # Checksum tools only verify one algorithm per manifest file
+        try:
+            algorithms = self.store.algorithms()
+        except sqlite3.Error as e:
+            QMessageBox.warning(self, "Export Manifest", f"Could not read history: {e}")
+            return
+        if not algorithms:
+            return
+        algorithm, ok = QInputDialog.getItem(
+            self, "Export Manifest", "Algorithm:", algorithms, 0, False
+        )
+        if not ok:
+            return
+        extension = algorithm.replace("-", "").lower()
+        self.export(
+            f"{algorithm} manifest (*.{extension})",
+            lambda path, search: self.store.export_manifest(path, algorithm, search),
+        )
+
+    def export(self, file_filter, writer):
+        filename, _ = QFileDialog.getSaveFileName(self, "Export history", "", file_filter)
+        if not filename:
+            return
+        try:
+            writer(filename, self.model.search)
+        except (OSError, sqlite3.Error) as e:
+            QMessageBox.warning(self, "Export history", f"Export failed: {e}")
+
+    def clear_history(self):
+        answer = QMessageBox.question(
+            self, "Clear History", "Delete all stored checksum history?"
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            self.store.clear()
+        except sqlite3.Error as e:
+            QMessageBox.warning(self, "Clear History", f"Could not clear history: {e}")
+            return
+        self.refresh()
@@ -17,7 +17,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QIcon, QFont, QAction, QKeySequence
 from checksum_calculator import ChecksumCalculator
+from history_store import HistoryStore
+from history_window import HistoryWindow
 import os
+import sqlite3
+import time
 
 
 class MainWindow(QMainWindow):
@@ -29,6 +33,11 @@ class MainWindow(QMainWindow):
         self.showMaximized()
         self.setFixedSize(self.size())
         self.calculator = ChecksumCalculator()
+        try:
+            self.history = HistoryStore()
+        except (OSError, sqlite3.Error):
+            self.history = None  # Run without history rather than not at all
+        self.history_window = None
         self.setStyleSheet(
             """
             QMainWindow {
@@ -44,6 +53,7 @@ class MainWindow(QMainWindow):
         self.icon_font = QFont()
         self.icon_font.setPointSize(16)
         self.current_file = None  # Add this line
+        self.quick_fingerprints = {}  # (filepath, hash_type) -> fingerprint
         self.feedback_timer = QTimer()
         self.feedback_timer.timeout.connect(self.reset_feedback)
         self.feedback_timer.setSingleShot(True)
@@ -75,6 +85,11 @@ class MainWindow(QMainWindow):
         clear_action.triggered.connect(self.clear_form)
         file_menu.addAction(clear_action)
 
+        quick_action = QAction("&Quick Check", self)
+        quick_action.setShortcut(QKeySequence("Ctrl+Shift+K"))
+        quick_action.triggered.connect(self.quick_check)
+        file_menu.addAction(quick_action)
+
         file_menu.addSeparator()
 
         exit_action = QAction("E&xit", self)
@@ -82,6 +97,14 @@ class MainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        # View menu
+        view_menu = menubar.addMenu("&View")
+
+        history_action = QAction("&History...", self)
+        history_action.setShortcut(QKeySequence("Ctrl+H"))
+        history_action.triggered.connect(self.show_history)
+        view_menu.addAction(history_action)
+
         # Help menu
         help_menu = menubar.addMenu("&Help")
 
@@ -475,21 +498,158 @@ class MainWindow(QMainWindow):
             hash_type = self.hash_combo.currentText()
 
             # Update file info
-            file_size = os.path.getsize(filepath)
-            file_name = os.path.basename(filepath)
-            size_str = self.format_size(file_size)
-            self.file_info_label.setText(f"File: {file_name} ({size_str})")
-
+            stat = self.show_file_info(filepath)
+            file_size = stat.st_size
+
+            # Reuse a stored digest if the file is unchanged since it was hashed
+            stored = None
+            if self.history is not None:
+                stored = self.history.lookup(
+                    filepath, hash_type, file_size, stat.st_mtime_ns
+                )
+            if stored is not None:
+                result, fingerprint = stored
+                self.result_label.setText(result)
+                self.copy_button.setEnabled(True)
+                # The baseline must be the fingerprint taken with this digest
+                self.set_quick_baseline(filepath, hash_type, fingerprint)
+                self.show_status(f"{hash_type} checksum loaded from history", "#28a745")
+                return
+
+            # Fingerprint first so it describes the contents being hashed
+            start = time.perf_counter()
+            fingerprint = self.calculator.quick_fingerprint(filepath, hash_type)
             result = self.calculator.calculate(filepath, hash_type)
+            duration = time.perf_counter() - start
             self.result_label.setText(result)
             self.copy_button.setEnabled(True)
-            self.show_status(f"Checksum calculated using {hash_type}", "#28a745")
+            if result.startswith("Error:"):
+                self.show_status(result, "#dc3545")
+                return
+
+            history_error = self.record_digest(
+                filepath, hash_type, stat, result, duration, fingerprint
+            )
+            if history_error:
+                self.show_status(
+                    f"Checksum calculated using {hash_type}, {history_error}",
+                    "#856404",
+                )
+            else:
+                self.show_status(f"Checksum calculated using {hash_type}", "#28a745")
         except Exception as e:
             self.show_status(f"Error: {str(e)}", "#dc3545")
         finally:
             self.progress_bar.hide()
             QApplication.processEvents()  # Ensure UI is updated
 
+    def quick_check(self):
+        if not self.current_file:
+            self.show_status("Select a file first", "#856404")
+            return
+
+        hash_type = self.hash_combo.currentText()
+        baseline = self.quick_fingerprints.get((self.current_file, hash_type))
+        try:
+            stat = os.stat(self.current_file)
+        except OSError as e:
+            self.show_status(f"Error: {str(e)}", "#dc3545")
+            return
+
+        # Falls back to a full hash on mismatch or when there is no baseline
+        start = time.perf_counter()
+        fingerprint, result = self.calculator.quick_check(
+            self.current_file, hash_type, baseline
+        )
+        duration = time.perf_counter() - start
+        if fingerprint.startswith("Error:"):
+            self.show_status(fingerprint, "#dc3545")
+            return
+
+        if result is None:
+            # Sampled fingerprint only, the displayed digest is not re-verified
+            self.show_status(
+                "Quick check: no change detected (sampled, not a full digest)",
+                "#28a745",
+            )
+            return
+
+        self.show_file_info(self.current_file)
+        self.result_label.setText(result)
+        self.copy_button.setEnabled(True)
+        if result.startswith("Error:"):
+            self.show_status(result, "#dc3545")
+            return
+
+        history_error = self.record_digest(
+            self.current_file, hash_type, stat, result, duration, fingerprint
+        )
+        if baseline is None:
+            message = f"Quick check: no baseline, full {hash_type} computed"
+            color = "#333333"
+        else:
+            message = f"Quick check: file changed, full {hash_type} recalculated"
+            color = "#856404"
+        if history_error:
+            message = f"{message}, {history_error}"
+            color = "#856404"
+        self.show_status(message, color)
+
+    def record_digest(self, filepath, hash_type, stat, result, duration, fingerprint):
+        # Stores a full digest with the quick fingerprint taken alongside it,
+        # which also becomes the quick check baseline. stat must be taken
+        # before hashing so a file modified mid-read is not cached as
+        # unchanged. Returns an error message if the history write failed.
+        self.set_quick_baseline(filepath, hash_type, fingerprint)
+        if self.history is None:
+            return None
+
+        try:
+            self.history.add(
+                filepath, stat.st_size, stat.st_mtime_ns, hash_type, result,
+                duration, fingerprint,
+            )
+            if self.history_window is not None and self.history_window.isVisible():
+                self.history_window.entry_added()
+        except sqlite3.Error as e:
+            return f"history not saved: {str(e)}"
+        return None
+
+    def set_quick_baseline(self, filepath, hash_type, fingerprint):
+        key = (filepath, hash_type)
+        if fingerprint and not fingerprint.startswith("Error:"):
+            self.quick_fingerprints[key] = fingerprint
+        else:
+            self.quick_fingerprints.pop(key, None)
+
+    def show_file_info(self, filepath):
+        stat = os.stat(filepath)
+        file_name = os.path.basename(filepath)
+        size_str = self.format_size(stat.st_size)
+        self.file_info_label.setText(f"File: {file_name} ({size_str})")
+        return stat
+
+    def show_history(self):
+        if self.history is None:
+            self.show_status("History is unavailable", "#dc3545")
+            return
+        if self.history_window is None:
+            self.history_window = HistoryWindow(
+                self.history, self.format_size, self.open_history_entry, self
+            )
+        self.history_window.show()
+        self.history_window.raise_()
+
+    def open_history_entry(self, filepath, algorithm):
+        if not os.path.exists(filepath):
+            self.show_status(f"File no longer exists: {filepath}", "#dc3545")
+            return
+        # Switch algorithm without triggering a recalculation of the old file
+        self.hash_combo.blockSignals(True)
+        self.hash_combo.setCurrentText(algorithm)
+        self.hash_combo.blockSignals(False)
+        self.calculate_checksum(filepath)
+
     def format_size(self, size):
         for unit in ["B", "KB", "MB", "GB", "TB"]:
             if size < 1024.0: